@@ -82,6 +82,24 @@ def calculate_daily_indicators(df):
     df['ADX'] = talib.ADX(df['High'], df['Low'], df['Adj Close'], timeperiod=14)
     return df[['Open', 'Close', 'Adj Close', 'VWSMA_200', 'VWEMA_50', 'VWEMA_20', 'RSI_Daily', 'ADX']]
 
+def calculate_indicators(df, time_frame):
+    """
+    Calculate the indicators for a DataFrame according to its time frame.
+
+    Parameters:
+    - df (pandas.DataFrame): DataFrame read with `read_csv`.
+    - time_frame (str): One of 'daily', 'weekly' or 'monthly'.
+
+    Returns:
+    - df_indicators (pandas.DataFrame): DataFrame containing the calculated indicators.
+    """
+    if time_frame == 'daily':
+        return calculate_daily_indicators(df)
+    elif time_frame == 'weekly':
+        return calculate_weekly_indicators(df)
+    else:  # Monthly
+        return calculate_monthly_indicators(df)
+
 def main():
     # Specify the folder containing stock data
     stock_data_folder = "/home/tanishpatel01/Desktop/Stock_Market_Data/Data"  # Replace with the path to your stock data folder
@@ -104,12 +122,7 @@ def main():
             if os.path.exists(file_path):
                 df = read_csv(file_path)
 
-                if time_frame == 'daily':
-                    indicators_df = calculate_daily_indicators(df)
-                elif time_frame == 'weekly':
-                    indicators_df = calculate_weekly_indicators(df)
-                else:  # Monthly
-                    indicators_df = calculate_monthly_indicators(df)
+                indicators_df = calculate_indicators(df, time_frame)
 
                 # Save the indicators to a new folder
                 indicators_folder = "indicators"
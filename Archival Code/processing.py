@@ -2,6 +2,13 @@ import pandas as pd
 import os
 import glob
 
+# Date ranges kept for each time frame
+intervals = {
+    'daily': ('2017-10-30', '2024-03-01'),
+    'weekly': ('2017-10-30', '2024-02-26'),
+    'monthly': ('2017-10-01', '2024-03-01')
+}
+
 def read_and_filter_data(file_path, start_date, end_date):
     """
     Read a CSV file, filter the data based on the specified date range, and return the filtered DataFrame.
@@ -28,12 +35,6 @@ def process_indicators(indicators_folder):
     Returns:
     - None
     """
-    intervals = {
-        'daily': ('2017-10-30', '2024-03-01'),
-        'weekly': ('2017-10-30', '2024-02-26'),
-        'monthly': ('2017-10-01', '2024-03-01')
-    }
-
     # Create 'indicators_processed' folder if it doesn't exist
     processed_folder = os.path.join(indicators_folder, "indicators_processed")
     if not os.path.exists(processed_folder):
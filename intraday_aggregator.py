@@ -0,0 +1,224 @@
+import os
+import glob
+import numpy as np
+import pandas as pd
+
+# Column order of the daily files read by indicator_script.read_csv
+DAILY_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+
+# Sidecar written next to every daily file this script builds, to tell it apart from vendor files
+AGGREGATED_MARKER_SUFFIX = '.aggregated'
+
+def iter_intraday_chunks(file_path, chunksize=1_000_000):
+    """
+    Yield fixed-size chunks of an intraday CSV or Parquet file without loading it whole.
+
+    Parameters:
+    - file_path (str): Path to a .csv or .parquet file of intraday bars.
+    - chunksize (int): Number of rows per chunk.
+
+    Returns:
+    - chunks (generator): Generator of pandas.DataFrame chunks.
+    """
+    if file_path.endswith('.parquet'):
+        # pyarrow is only needed for Parquet input
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(file_path, chunksize=chunksize)
+
+def local_timestamps(timestamps, datetime_format=None, epoch_unit='s'):
+    """
+    Convert a column of intraday timestamps to naive local wall-clock datetimes.
+
+    ISO-formatted strings are cut to their 'YYYY-MM-DD HH:MM:SS' prefix instead of being
+    parsed in full, which is several times faster and keeps the exchange's local time even
+    when the timestamps carry a UTC offset. Sub-second precision is dropped on that path.
+    Integer or float columns are read as epoch times in `epoch_unit`; they carry no offset,
+    so their days are UTC days.
+
+    Parameters:
+    - timestamps (pandas.Series): Timestamp strings, epoch numbers or datetime values.
+    - datetime_format (str): Optional strftime format of the timestamps; forces a full parse.
+    - epoch_unit (str): Unit of numeric epoch timestamps ('s', 'ms', 'us' or 'ns').
+
+    Returns:
+    - timestamps (numpy.ndarray): datetime64[ns] array of local times.
+    """
+    if pd.api.types.is_numeric_dtype(timestamps) and not pd.api.types.is_bool_dtype(timestamps):
+        return pd.to_datetime(timestamps, unit=epoch_unit).to_numpy().astype('datetime64[ns]')
+
+    if datetime_format is None and pd.api.types.is_string_dtype(timestamps):
+        try:
+            return timestamps.str.slice(0, 19).to_numpy().astype('datetime64[s]').astype('datetime64[ns]')
+        except ValueError:
+            pass
+
+    timestamps = pd.to_datetime(timestamps, format=datetime_format)
+    if timestamps.dt.tz is not None:
+        # Keep the exchange's wall-clock time so sessions are not split at UTC midnight
+        timestamps = timestamps.dt.tz_localize(None)
+    return timestamps.to_numpy().astype('datetime64[ns]')
+
+def integral_volume(volume):
+    """
+    Return summed volumes as int64 when they are all whole numbers, else unchanged.
+
+    Parameters:
+    - volume (numpy.ndarray): float64 array of summed volumes.
+
+    Returns:
+    - volume (numpy.ndarray): int64 array if every value is integral, else the input.
+    """
+    if np.all(np.mod(volume, 1) == 0):
+        return volume.astype(np.int64)
+    return volume
+
+def aggregate_chunk(chunk, timestamps):
+    """
+    Roll a chunk of time-ordered intraday bars into one row per trading day.
+
+    Day boundaries are found on the sorted timestamps and every column is reduced with
+    a single NumPy `reduceat`, so the cost is linear in the chunk size. Missing volumes
+    count as zero.
+
+    Parameters:
+    - chunk (pandas.DataFrame): Intraday bars with 'Open', 'High', 'Low', 'Close', 'Volume'
+      (and optionally 'Adj Close') columns.
+    - timestamps (numpy.ndarray): Local times of the bars, as returned by `local_timestamps`.
+
+    Returns:
+    - daily_df (pandas.DataFrame): Daily OHLCV bars with DAILY_COLUMNS columns.
+    """
+    if (timestamps[1:] < timestamps[:-1]).any():
+        raise ValueError("Intraday bars must be sorted by time.")
+
+    days = timestamps.astype('datetime64[D]')
+    starts = np.concatenate(([0], np.flatnonzero(days[1:] != days[:-1]) + 1))
+    ends = np.concatenate((starts[1:], [len(days)])) - 1
+
+    close = chunk['Close'].to_numpy(dtype=np.float64)
+    adj_close = chunk['Adj Close'].to_numpy(dtype=np.float64) if 'Adj Close' in chunk else close
+    volume = np.nan_to_num(chunk['Volume'].to_numpy(dtype=np.float64))
+
+    return pd.DataFrame({
+        'Date': days[starts],
+        'Open': chunk['Open'].to_numpy(dtype=np.float64)[starts],
+        'High': np.maximum.reduceat(chunk['High'].to_numpy(dtype=np.float64), starts),
+        'Low': np.minimum.reduceat(chunk['Low'].to_numpy(dtype=np.float64), starts),
+        'Close': close[ends],
+        'Adj Close': adj_close[ends],
+        'Volume': integral_volume(np.add.reduceat(volume, starts)),
+    })
+
+def merge_partial_day(daily_df):
+    """
+    Merge a day left unfinished at the end of one chunk with its continuation in the next.
+
+    Parameters:
+    - daily_df (pandas.DataFrame): Daily bars whose first two rows are the earlier and
+      later parts of the same day.
+
+    Returns:
+    - merged_df (pandas.DataFrame): Daily bars with those two rows combined into one.
+    """
+    partial = daily_df.iloc[0]
+    daily_df.loc[1, 'Open'] = partial['Open']
+    daily_df.loc[1, 'High'] = max(partial['High'], daily_df.loc[1, 'High'])
+    daily_df.loc[1, 'Low'] = min(partial['Low'], daily_df.loc[1, 'Low'])
+    # Sum in float so an integer part and a fractional part cannot truncate each other
+    volume = daily_df['Volume'].to_numpy(dtype=np.float64, copy=True)
+    volume[1] += volume[0]
+    merged_df = daily_df.iloc[1:].copy()
+    merged_df['Volume'] = integral_volume(volume[1:])
+    return merged_df
+
+def aggregate_intraday(input_path, output_path, chunksize=1_000_000, datetime_column='Datetime',
+                       datetime_format=None, epoch_unit='s'):
+    """
+    Stream an intraday file into a daily OHLCV CSV that `indicator_script.read_csv` can read.
+
+    Only one chunk and the last, possibly incomplete, day are held in memory at a time;
+    completed days are appended to a temporary file as soon as they are known, which
+    replaces `output_path` once the whole input has been read.
+
+    Parameters:
+    - input_path (str): Path to a time-ordered intraday .csv or .parquet file.
+    - output_path (str): Path of the daily CSV to write.
+    - chunksize (int): Number of intraday rows read per chunk.
+    - datetime_column (str): Name of the timestamp column.
+    - datetime_format (str): Optional strftime format of non-ISO timestamps.
+    - epoch_unit (str): Unit of numeric epoch timestamps ('s', 'ms', 'us' or 'ns').
+
+    Returns:
+    - n_days (int): Number of daily bars written.
+    """
+    # Write to a temporary file so a failed run never leaves a truncated daily file behind
+    tmp_path = output_path + '.tmp'
+    pd.DataFrame(columns=DAILY_COLUMNS).to_csv(tmp_path, index=False)
+    pending = None
+    previous_timestamp = None
+    n_days = 0
+
+    try:
+        for chunk in iter_intraday_chunks(input_path, chunksize):
+            if chunk.empty:
+                continue
+            timestamps = local_timestamps(chunk[datetime_column], datetime_format, epoch_unit)
+            if previous_timestamp is not None and timestamps[0] < previous_timestamp:
+                raise ValueError("Intraday bars must be sorted by time.")
+            previous_timestamp = timestamps[-1]
+            daily_df = aggregate_chunk(chunk, timestamps)
+
+            if pending is not None:
+                daily_df = pd.concat([pending, daily_df], ignore_index=True)
+                if daily_df['Date'].iloc[1] == daily_df['Date'].iloc[0]:
+                    daily_df = merge_partial_day(daily_df)
+
+            # The last day may continue in the next chunk, so hold it back
+            pending = daily_df.iloc[-1:].reset_index(drop=True)
+            completed = daily_df.iloc[:-1]
+            completed.to_csv(tmp_path, mode='a', header=False, index=False, date_format='%Y-%m-%d')
+            n_days += len(completed)
+
+        if pending is not None:
+            pending.to_csv(tmp_path, mode='a', header=False, index=False, date_format='%Y-%m-%d')
+            n_days += 1
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, output_path)
+    return n_days
+
+def main():
+    # Specify the folder containing stock data
+    stock_data_folder = "/home/tanishpatel01/Desktop/Stock_Market_Data/Data"  # Replace with the path to your stock data folder
+
+    # Loop through each stock and build its daily file from the minute bars
+    for stock_folder in glob.glob(stock_data_folder + "/*"):
+        stock_name = os.path.basename(stock_folder)
+
+        for extension in ('parquet', 'csv'):
+            input_path = f"{stock_folder}/{stock_name}_1m.{extension}"
+            if os.path.exists(input_path):
+                output_path = f"{stock_folder}/{stock_name}_1d.csv"
+                marker_path = output_path + AGGREGATED_MARKER_SUFFIX
+                # Daily files without a marker may hold vendor Adj Close values, so never overwrite them
+                if os.path.exists(output_path) and not os.path.exists(marker_path):
+                    print(f"Skipping {stock_name}: {output_path} was not built from intraday data.")
+                elif os.path.exists(output_path) and os.path.getmtime(output_path) >= os.path.getmtime(input_path):
+                    print(f"Skipping {stock_name}: {output_path} is up to date.")
+                else:
+                    n_days = aggregate_intraday(input_path, output_path)
+                    with open(marker_path, 'w') as f:
+                        f.write(input_path + '\n')
+                    print(f"Saved {n_days} daily bars to {output_path}")
+                break
+        else:
+            print(f"No intraday data found for {stock_name}.")
+
+if __name__ == "__main__":
+    main()
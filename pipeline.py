@@ -0,0 +1,334 @@
+import os
+import glob
+import json
+import hashlib
+import argparse
+import importlib.util
+
+# indicator_script.py and processing.py live in the archival folder
+ARCHIVAL_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Archival Code')
+
+def load_archival_module(name):
+    """
+    Import a module from the archival folder by file path.
+
+    The folder is not put on sys.path, so its test.py and app.py cannot shadow other modules.
+
+    Parameters:
+    - name (str): Module name, e.g. 'processing'.
+
+    Returns:
+    - module (module): The imported module.
+    """
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ARCHIVAL_FOLDER, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+processing = load_archival_module('processing')
+
+# Bump to invalidate every cached result when the stage wiring below changes
+PIPELINE_VERSION = 1
+
+STAGES = ['indicators', 'processing', 'scoring']
+
+# Mapping of raw data intervals to time frames, as in indicator_script.main
+time_frame_mapping = {
+    '1d': 'daily',
+    '1wk': 'weekly',
+    '1mo': 'monthly'
+}
+
+# Source files whose content versions each stage
+STAGE_CODE = {
+    'indicators': [os.path.join(ARCHIVAL_FOLDER, 'indicator_script.py')],
+    'processing': [os.path.join(ARCHIVAL_FOLDER, 'processing.py')],
+    'scoring': [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripting.py')],
+}
+
+class StageCache:
+    """
+    Content-addressed store of stage results.
+
+    Each task is keyed by a hash of everything that determines its outputs. A task is a hit
+    when its key matches the stored one and its output files still hold the content they
+    were written with. File digests are memoised on (size, mtime), so unchanged files are
+    not re-read on every run.
+    """
+
+    def __init__(self, cache_folder):
+        self.cache_folder = cache_folder
+        self.manifest_path = os.path.join(cache_folder, 'manifest.json')
+        self.file_hashes_path = os.path.join(cache_folder, 'file_hashes.json')
+        self.manifest = self._load(self.manifest_path)
+        self.file_hashes = self._load(self.file_hashes_path)
+        self.hits = {stage: 0 for stage in STAGES}
+        self.misses = {stage: 0 for stage in STAGES}
+
+    @staticmethod
+    def _load(path):
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+        return {}
+
+    def file_digest(self, path):
+        """
+        Return the SHA-256 digest of a file's content, or None if it does not exist.
+
+        Parameters:
+        - path (str): Path of the file.
+
+        Returns:
+        - digest (str): Hex digest of the file content.
+        """
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        signature = [stat.st_size, stat.st_mtime_ns]
+        memo = self.file_hashes.get(os.path.abspath(path))
+        if memo is not None and memo['signature'] == signature:
+            return memo['digest']
+
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                sha.update(block)
+        digest = sha.hexdigest()
+        self.file_hashes[os.path.abspath(path)] = {'signature': signature, 'digest': digest}
+        return digest
+
+    def task_key(self, stage, inputs):
+        """
+        Hash a stage's inputs together with the version of its code.
+
+        Parameters:
+        - stage (str): Stage name.
+        - inputs (dict): JSON-serialisable description of the task's inputs.
+
+        Returns:
+        - key (str): Hex digest identifying the task's outputs.
+        """
+        payload = {
+            'pipeline_version': PIPELINE_VERSION,
+            'stage': stage,
+            'code': [self.file_digest(path) for path in STAGE_CODE[stage]],
+            'inputs': inputs,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def is_hit(self, task_id, key, output_paths):
+        entry = self.manifest.get(task_id)
+        if entry is None or entry['key'] != key:
+            return False
+        # Outputs stored elsewhere do not satisfy a request for these paths
+        if sorted(entry['outputs']) != sorted(os.path.abspath(path) for path in output_paths):
+            return False
+        return all(self.file_digest(path) == digest for path, digest in entry['outputs'].items())
+
+    def record(self, task_id, key, output_paths):
+        self.manifest[task_id] = {
+            'key': key,
+            'outputs': {os.path.abspath(path): self.file_digest(path) for path in output_paths},
+        }
+
+    def invalidate(self, stage=None, ticker=None):
+        """
+        Drop stored results so the matching tasks are recomputed on the next run.
+
+        Parameters:
+        - stage (str): Only drop tasks of this stage; all stages if None.
+        - ticker (str): Only drop tasks of this ticker; all tickers if None.
+
+        Returns:
+        - n_dropped (int): Number of stored results dropped.
+        """
+        n_dropped = 0
+        for task_id in list(self.manifest):
+            task_stage, task_ticker = task_id.split(':')[:2]
+            if (stage is None or task_stage == stage) and (ticker is None or task_ticker == ticker):
+                del self.manifest[task_id]
+                n_dropped += 1
+        return n_dropped
+
+    def save(self):
+        os.makedirs(self.cache_folder, exist_ok=True)
+        for path, data in ((self.manifest_path, self.manifest), (self.file_hashes_path, self.file_hashes)):
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+
+def parse_invalidate(entry):
+    """
+    Split an --invalidate entry into the stage and ticker it selects.
+
+    Parameters:
+    - entry (str): 'STAGE', 'TICKER' or 'STAGE:TICKER'.
+
+    Returns:
+    - stage (str): Selected stage, or None for all stages.
+    - ticker (str): Selected ticker, or None for all tickers.
+    """
+    stage, separator, ticker = entry.partition(':')
+    if stage in STAGES:
+        return stage, ticker or None
+    if separator:
+        raise ValueError(f"unknown stage '{stage}' in --invalidate {entry}, expected one of {', '.join(STAGES)}")
+    return None, entry
+
+def run_task(cache, stage, task_id, inputs, output_paths, compute, force=False):
+    """
+    Run a task unless an identical one has already produced its outputs.
+
+    Parameters:
+    - cache (StageCache): Cache the task is looked up in and recorded to.
+    - stage (str): Stage name.
+    - task_id (str): Identifier of the task, '{stage}:{ticker}[:{interval}]'.
+    - inputs (dict): JSON-serialisable description of the task's inputs.
+    - output_paths (list): Files the task writes.
+    - compute (callable): Function that runs the task and writes `output_paths`.
+    - force (bool): Recompute even on a hit.
+
+    Returns:
+    - hit (bool): True if the stored outputs were reused.
+    """
+    key = cache.task_key(stage, inputs)
+    if not force and cache.is_hit(task_id, key, output_paths):
+        cache.hits[stage] += 1
+        return True
+
+    compute()
+    cache.record(task_id, key, output_paths)
+    cache.misses[stage] += 1
+    return False
+
+def compute_indicators(source_path, time_frame, output_path):
+    # Imported lazily so runs that hit the cache do not need talib and pandas_ta
+    indicator_script = load_archival_module('indicator_script')
+    df = indicator_script.read_csv(source_path)
+    indicators_df = indicator_script.calculate_indicators(df, time_frame)
+    indicators_df.to_csv(output_path)
+
+def compute_processed(input_path, time_frame, output_path):
+    filtered_df = processing.read_and_filter_data(input_path, *processing.intervals[time_frame])
+    filtered_df.to_csv(output_path)
+
+def compute_scores(script, processed_folder, output_folder):
+    import scripting
+    scripting.process_script(script, processed_folder, output_folder)
+
+def discover_tickers(data_folder, indicators_folder):
+    """
+    List tickers that have raw data or prebuilt indicator files.
+
+    Parameters:
+    - data_folder (str): Folder with one {stock}/{stock}_{interval}.csv folder per stock.
+    - indicators_folder (str): Folder with {stock}_{time_frame}_indicators.csv files.
+
+    Returns:
+    - tickers (list): Sorted ticker names.
+    """
+    tickers = {os.path.basename(path) for path in glob.glob(os.path.join(data_folder, '*')) if os.path.isdir(path)}
+    for path in glob.glob(os.path.join(indicators_folder, '*_indicators.csv')):
+        tickers.add(os.path.basename(path).rsplit('_', 2)[0])
+    return sorted(tickers)
+
+def run_pipeline(tickers, data_folder, indicators_folder='indicators', processed_folder='indicators_processed',
+                 output_folder='.', cache_folder='.stage_cache', force=False, invalidate=()):
+    """
+    Run the indicator, processing and scoring stages, reusing cached results where inputs are unchanged.
+
+    Keys chain off the content of upstream outputs, so a recomputed stage whose output
+    did not change still lets the stages after it hit the cache. Indicator and threshold
+    parameters are part of each stage's code and are covered by its code digest.
+
+    Parameters:
+    - tickers (list): Tickers to run.
+    - data_folder (str): Folder with one {stock}/{stock}_{interval}.csv folder per stock.
+    - indicators_folder (str): Folder for {stock}_{time_frame}_indicators.csv files.
+    - processed_folder (str): Folder for {stock}_{time_frame}_indicators_processed.csv files.
+    - output_folder (str): Folder for the tag and transaction CSVs.
+    - cache_folder (str): Folder holding the cache manifest.
+    - force (bool): Recompute every task.
+    - invalidate (list): Entries 'STAGE', 'TICKER' or 'STAGE:TICKER' whose results are dropped.
+      Raises ValueError for a 'STAGE:' prefix that is not a known stage.
+
+    Returns:
+    - cache (StageCache): Cache holding the hit and miss counts of the run.
+    """
+    selections = [(entry, parse_invalidate(entry)) for entry in invalidate]
+    cache = StageCache(cache_folder)
+    for entry, (stage, ticker) in selections:
+        if cache.invalidate(stage, ticker) == 0:
+            print(f"Warning: --invalidate {entry} matched no cached results.")
+
+    for folder in (indicators_folder, processed_folder, output_folder):
+        os.makedirs(folder, exist_ok=True)
+
+    # Save after any failure too, so tickers that already finished are not redone next run
+    try:
+        for ticker in tickers:
+            for interval, time_frame in time_frame_mapping.items():
+                indicators_path = os.path.join(indicators_folder, f'{ticker}_{time_frame}_indicators.csv')
+                source_path = os.path.join(data_folder, ticker, f'{ticker}_{interval}.csv')
+
+                # Without raw data the prebuilt indicator file is the source of the chain
+                if os.path.exists(source_path):
+                    run_task(cache, 'indicators', f'indicators:{ticker}:{time_frame}',
+                             {'source': cache.file_digest(source_path), 'time_frame': time_frame},
+                             [indicators_path],
+                             lambda: compute_indicators(source_path, time_frame, indicators_path), force)
+
+                processed_path = os.path.join(processed_folder, f'{ticker}_{time_frame}_indicators_processed.csv')
+                if os.path.exists(indicators_path):
+                    run_task(cache, 'processing', f'processing:{ticker}:{time_frame}',
+                             {'source': cache.file_digest(indicators_path), 'time_frame': time_frame,
+                              'date_range': processing.intervals[time_frame]},
+                             [processed_path],
+                             lambda: compute_processed(indicators_path, time_frame, processed_path), force)
+
+            processed_paths = [os.path.join(processed_folder, f'{ticker}_{time_frame}_indicators_processed.csv')
+                               for time_frame in time_frame_mapping.values()]
+            if all(os.path.exists(path) for path in processed_paths):
+                run_task(cache, 'scoring', f'scoring:{ticker}',
+                         {'sources': [cache.file_digest(path) for path in processed_paths]},
+                         [os.path.join(output_folder, f'{ticker}_updated_daily_data.csv'),
+                          os.path.join(output_folder, f'{ticker}_transactions.csv')],
+                         lambda: compute_scores(ticker, processed_folder, output_folder), force)
+            else:
+                print(f"Missing processed indicators for {ticker}, skipping scoring.")
+    finally:
+        cache.save()
+    return cache
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the indicator, processing and scoring stages with caching.")
+    parser.add_argument('tickers', nargs='*', help="Tickers to run (default: all discovered tickers)")
+    parser.add_argument('--data-folder', default="/home/tanishpatel01/Desktop/Stock_Market_Data/Data")
+    parser.add_argument('--indicators-folder', default='indicators')
+    parser.add_argument('--processed-folder', default='indicators_processed')
+    parser.add_argument('--output-folder', default='.')
+    parser.add_argument('--cache-folder', default='.stage_cache')
+    parser.add_argument('--force', action='store_true', help="Recompute every task")
+    parser.add_argument('--invalidate', action='append', default=[], metavar='STAGE[:TICKER]|TICKER',
+                        help="Drop cached results for a stage, a ticker, or a stage of one ticker")
+    args = parser.parse_args()
+
+    # Reject bad entries before any work starts; run_pipeline parses them again when applying them
+    for entry in args.invalidate:
+        try:
+            parse_invalidate(entry)
+        except ValueError as error:
+            parser.error(str(error))
+
+    tickers = args.tickers or discover_tickers(args.data_folder, args.indicators_folder)
+    cache = run_pipeline(tickers, args.data_folder, args.indicators_folder, args.processed_folder,
+                         args.output_folder, args.cache_folder, args.force, args.invalidate)
+
+    for stage in STAGES:
+        print(f"{stage}: {cache.hits[stage]} hits, {cache.misses[stage]} misses")
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 from datetime import timedelta
 
@@ -121,12 +122,23 @@ def generate_transactions(daily_data, result_df, script):
 
     return pd.DataFrame(transactions, columns=['Script', 'Buy_Date', 'Sell_Date', 'Return'])
 
-# Loop through each script and perform the operations
-for script in scripts:
+# Function to calculate tags and transactions for a single script and save them to CSV
+def process_script(script, processed_folder='indicators_processed', output_folder='.'):
+    """
+    Calculate buy and sell tags and transactions for a script and save them to CSV.
+
+    Parameters:
+    - script (str): Stock script name (e.g. 'WIPRO').
+    - processed_folder (str): Folder containing the processed indicator CSVs.
+    - output_folder (str): Folder the tag and transaction CSVs are written to.
+
+    Returns:
+    - output_paths (list): Paths of the files written.
+    """
     # Load the daily, weekly, and monthly datasets for the script
-    daily_data = pd.read_csv(f'indicators_processed/{script}_daily_indicators_processed.csv')
-    weekly_data = pd.read_csv(f'indicators_processed/{script}_weekly_indicators_processed.csv')
-    monthly_data = pd.read_csv(f'indicators_processed/{script}_monthly_indicators_processed.csv')
+    daily_data = pd.read_csv(f'{processed_folder}/{script}_daily_indicators_processed.csv')
+    weekly_data = pd.read_csv(f'{processed_folder}/{script}_weekly_indicators_processed.csv')
+    monthly_data = pd.read_csv(f'{processed_folder}/{script}_monthly_indicators_processed.csv')
 
     # Calculate buy and sell tags
     buy_results, sell_results = calculate_buy_sell_tags(daily_data, weekly_data, monthly_data)
@@ -135,12 +147,23 @@ for script in scripts:
     buy_df = pd.DataFrame(buy_results, columns=['Date', 'Buy_Tag'])
     sell_df = pd.DataFrame(sell_results, columns=['Date', 'Sell_Tag'])
     result_df = pd.merge(buy_df, sell_df, on='Date')
-    result_df.to_csv(f'{script}_updated_daily_data.csv', index=False)
+    tags_path = os.path.join(output_folder, f'{script}_updated_daily_data.csv')
+    result_df.to_csv(tags_path, index=False)
 
     # Generate transactions and calculate returns
     transactions_df = generate_transactions(daily_data, result_df, script)
 
     # Save the transactions to CSV
-    transactions_df.to_csv(f'{script}_transactions.csv', index=False)
+    transactions_path = os.path.join(output_folder, f'{script}_transactions.csv')
+    transactions_df.to_csv(transactions_path, index=False)
+
+    return [tags_path, transactions_path]
+
+def main():
+    # Loop through each script and perform the operations
+    for script in scripts:
+        process_script(script)
+        print(f'Processed {script}')
 
-    print(f'Processed {script}')
+if __name__ == "__main__":
+    main()
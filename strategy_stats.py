@@ -0,0 +1,243 @@
+import os
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from scripting import scripts
+
+# Upper bound on the number of array elements materialised per resampling chunk
+MAX_CHUNK_ELEMENTS = 2_000_000
+
+def load_transactions(file_path):
+    """
+    Read a transactions CSV produced by `generate_transactions`.
+
+    Parameters:
+    - file_path (str): Path to the {script}_transactions.csv file.
+
+    Returns:
+    - df (pandas.DataFrame): DataFrame with 'Script', 'Buy_Date', 'Sell_Date' and 'Return' columns.
+    """
+    df = pd.read_csv(file_path, parse_dates=['Buy_Date', 'Sell_Date'])
+    return df.dropna(subset=['Return'])
+
+def load_daily_prices(file_path):
+    """
+    Read a processed daily indicators CSV and return the trading dates and the mid prices
+    used by `generate_transactions`, i.e. (Open + Close) / 2.
+
+    Parameters:
+    - file_path (str): Path to the {script}_daily_indicators_processed.csv file.
+
+    Returns:
+    - dates (numpy.ndarray): Sorted datetime64 array of trading dates.
+    - prices (numpy.ndarray): float64 array of mid prices aligned with `dates`.
+    """
+    df = pd.read_csv(file_path, usecols=['Date', 'Open', 'Close'], parse_dates=['Date'])
+    df = df.sort_values('Date')
+    prices = ((df['Open'] + df['Close']) / 2).to_numpy(dtype=np.float64)
+    return df['Date'].to_numpy(), prices
+
+def holding_periods(dates, transactions):
+    """
+    Calculate the holding period of each transaction in trading days.
+
+    Parameters:
+    - dates (numpy.ndarray): Sorted datetime64 array of trading dates.
+    - transactions (pandas.DataFrame): DataFrame with 'Buy_Date' and 'Sell_Date' columns.
+
+    Returns:
+    - holds (numpy.ndarray): int32 array with the number of trading days between buy and sell.
+    """
+    buy_idx = np.searchsorted(dates, transactions['Buy_Date'].to_numpy())
+    sell_idx = np.searchsorted(dates, transactions['Sell_Date'].to_numpy())
+    return np.maximum(sell_idx - buy_idx, 0).astype(np.int32)
+
+def entry_clusters(transactions):
+    """
+    Label each transaction with the buy it belongs to.
+
+    `generate_transactions` pairs every buy with every later sell, so the rows sharing a
+    'Buy_Date' come from a single entry and are not independent trades.
+
+    Parameters:
+    - transactions (pandas.DataFrame): DataFrame with a 'Buy_Date' column.
+
+    Returns:
+    - clusters (numpy.ndarray): int array mapping each row to its entry, numbered from 0.
+    """
+    return pd.factorize(transactions['Buy_Date'], sort=True)[0]
+
+def _chunk_rows(n_columns, max_chunk_elements):
+    # Number of resamples per chunk so that a (rows x n_columns) array stays bounded
+    return max(1, max_chunk_elements // max(n_columns, 1))
+
+def bootstrap_means(returns, clusters, n_samples, rng, max_chunk_elements=MAX_CHUNK_ELEMENTS):
+    """
+    Bootstrap the mean trade return by resampling entries with replacement.
+
+    Whole entries are resampled together with all the trades they produced. Each chunk
+    draws a (rows x n_entries) index array and reduces it in a single NumPy operation, so
+    memory is bounded by `max_chunk_elements` regardless of `n_samples`.
+
+    Parameters:
+    - returns (numpy.ndarray): Observed per-trade returns.
+    - clusters (numpy.ndarray): Entry of each trade, as returned by `entry_clusters`.
+    - n_samples (int): Number of bootstrap resamples.
+    - rng (numpy.random.Generator): Random number generator.
+    - max_chunk_elements (int): Maximum number of elements drawn per chunk.
+
+    Returns:
+    - means (numpy.ndarray): Mean trade return of each bootstrap resample.
+    """
+    n_entries = clusters.max() + 1
+    entry_sums = np.bincount(clusters, weights=returns, minlength=n_entries)
+    entry_counts = np.bincount(clusters, minlength=n_entries).astype(np.float64)
+
+    means = np.empty(n_samples, dtype=np.float64)
+    rows = _chunk_rows(n_entries, max_chunk_elements)
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        idx = rng.integers(0, n_entries, size=(stop - start, n_entries), dtype=np.int32)
+        means[start:stop] = entry_sums[idx].sum(axis=1) / entry_counts[idx].sum(axis=1)
+    return means
+
+def random_entry_means(prices, holds, clusters, n_samples, rng, max_chunk_elements=MAX_CHUNK_ELEMENTS):
+    """
+    Simulate random-entry strategies matched on entry count and holding periods.
+
+    Every simulated strategy makes one entry per observed entry at a uniformly random
+    trading day and exits it after each of that entry's holding periods, so each row of
+    the (rows x n_trades) array is a baseline with the same exposure as the strategy.
+
+    Parameters:
+    - prices (numpy.ndarray): Daily mid prices.
+    - holds (numpy.ndarray): Holding period of each observed trade in trading days.
+    - clusters (numpy.ndarray): Entry of each trade, as returned by `entry_clusters`.
+    - n_samples (int): Number of simulated strategies.
+    - rng (numpy.random.Generator): Random number generator.
+    - max_chunk_elements (int): Maximum number of elements drawn per chunk.
+
+    Returns:
+    - means (numpy.ndarray): Mean trade return of each simulated strategy.
+    """
+    n_entries = clusters.max() + 1
+    max_holds = np.zeros(n_entries, dtype=np.int32)
+    np.maximum.at(max_holds, clusters, holds)
+    # Latest entry day that still leaves room for each entry's longest holding period
+    entry_limits = (len(prices) - max_holds).astype(np.int32)
+
+    means = np.empty(n_samples, dtype=np.float64)
+    rows = _chunk_rows(len(holds), max_chunk_elements)
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        entries = rng.integers(0, entry_limits, size=(stop - start, n_entries), dtype=np.int32)[:, clusters]
+        exits = entries + holds
+        means[start:stop] = (prices[exits] - prices[entries]).mean(axis=1)
+    return means
+
+def evaluate_script(script, transactions_folder='.', indicators_folder='indicators_processed',
+                    n_samples=10000, confidence=0.95, seed=None, max_chunk_elements=MAX_CHUNK_ELEMENTS):
+    """
+    Run bootstrap and random-entry significance tests on one script's transactions.
+
+    Parameters:
+    - script (str): Stock script name (e.g. 'WIPRO').
+    - transactions_folder (str): Folder containing {script}_transactions.csv.
+    - indicators_folder (str): Folder containing {script}_daily_indicators_processed.csv.
+    - n_samples (int): Number of bootstrap resamples and random-entry baselines.
+    - confidence (float): Confidence level of the reported intervals.
+    - seed (int or numpy.random.SeedSequence): Seed for reproducible sampling.
+    - max_chunk_elements (int): Maximum number of elements drawn per chunk.
+
+    Returns:
+    - result (dict): Observed mean return, bootstrap and baseline confidence intervals,
+      and one-sided p-values against zero and against random entry. The bootstrap
+      columns are NaN when there is only one entry.
+    """
+    transactions = load_transactions(os.path.join(transactions_folder, f'{script}_transactions.csv'))
+    dates, prices = load_daily_prices(os.path.join(indicators_folder, f'{script}_daily_indicators_processed.csv'))
+
+    holds = holding_periods(dates, transactions)
+    valid = holds < len(prices)
+    transactions = transactions[valid]
+    returns = transactions['Return'].to_numpy(dtype=np.float64)
+    holds = holds[valid]
+    clusters = entry_clusters(transactions)
+
+    result = {'Script': script, 'Trades': len(returns), 'Entries': len(np.unique(clusters))}
+    if len(returns) == 0:
+        return result
+
+    rng = np.random.default_rng(seed)
+    observed = returns.mean()
+    baseline = random_entry_means(prices, holds, clusters, n_samples, rng, max_chunk_elements)
+
+    tail = (1 - confidence) / 2 * 100
+    base_low, base_high = np.percentile(baseline, [tail, 100 - tail])
+
+    result.update({
+        'Mean_Return': observed,
+        'Mean_Holding_Days': holds.mean(),
+        'CI_Low': np.nan,
+        'CI_High': np.nan,
+        'Baseline_Mean': baseline.mean(),
+        'Baseline_CI_Low': base_low,
+        'Baseline_CI_High': base_high,
+        # Add-one smoothing keeps the p-values away from an impossible zero
+        'P_Value_Zero': np.nan,
+        'P_Value_Random_Entry': (np.count_nonzero(baseline >= observed) + 1) / (n_samples + 1),
+    })
+
+    # A single entry leaves nothing to resample, so the bootstrap would report a false certainty
+    if result['Entries'] > 1:
+        boot = bootstrap_means(returns, clusters, n_samples, rng, max_chunk_elements)
+        boot_low, boot_high = np.percentile(boot, [tail, 100 - tail])
+        result.update({
+            'CI_Low': boot_low,
+            'CI_High': boot_high,
+            # Centring the resamples on zero approximates the null of no mean return
+            'P_Value_Zero': (np.count_nonzero(boot - observed >= observed) + 1) / (n_samples + 1),
+        })
+    return result
+
+def run_significance_tests(scripts, transactions_folder='.', indicators_folder='indicators_processed',
+                           n_samples=10000, confidence=0.95, seed=None, workers=1,
+                           max_chunk_elements=MAX_CHUNK_ELEMENTS):
+    """
+    Run `evaluate_script` for every script, optionally fanning out across a process pool.
+
+    Each script gets its own child seed spawned from `seed`, so results are identical
+    whatever the number of workers.
+
+    Parameters:
+    - scripts (list): Stock script names.
+    - transactions_folder (str): Folder containing the transactions CSVs.
+    - indicators_folder (str): Folder containing the processed daily indicators CSVs.
+    - n_samples (int): Number of bootstrap resamples and random-entry baselines per script.
+    - confidence (float): Confidence level of the reported intervals.
+    - seed (int): Root seed for reproducible sampling.
+    - workers (int): Number of worker processes; 1 runs everything in this process.
+    - max_chunk_elements (int): Maximum number of elements drawn per chunk.
+
+    Returns:
+    - results_df (pandas.DataFrame): One row of test results per script.
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(scripts))
+    args = [(script, transactions_folder, indicators_folder, n_samples, confidence, child, max_chunk_elements)
+            for script, child in zip(scripts, seeds)]
+
+    if workers > 1 and len(scripts) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(evaluate_script, *zip(*args)))
+    else:
+        results = [evaluate_script(*a) for a in args]
+
+    return pd.DataFrame(results)
+
+def main():
+    results_df = run_significance_tests(scripts, n_samples=10000, seed=0)
+    results_df.to_csv('strategy_significance.csv', index=False)
+    print(results_df.to_string(index=False))
+
+if __name__ == "__main__":
+    main()